@@ -0,0 +1,12 @@
+"""Benchmarks of the computational kernels that are studied in the technical reports.
+
+Each benchmark turns a performance experiment from one of the technical reports into
+a function that is timed over a grid of parameters, like the number of events, the
+size of the amplitude model, or the computational backend. Run
+
+.. code-block:: shell
+
+    python -m report_benchmarks --help
+
+to see how to run the benchmarks and how to compare two runs.
+"""
@@ -0,0 +1,148 @@
+"""Command-line interface for running and comparing the benchmarks."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from report_benchmarks.compare import (
+    compare_metadata,
+    compare_results,
+    format_comparisons,
+)
+from report_benchmarks.registry import BENCHMARKS, format_case_id
+from report_benchmarks.run import RESULTS_VERSION, run_benchmarks
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("report_benchmarks").setLevel(logging.INFO)
+    if args.command == "compare":
+        return _compare(args.baseline, args.contender, args.threshold)
+    import report_benchmarks.cases  # noqa: F401, PLC0415
+
+    if args.command == "list":
+        return _list(args.patterns, args.quick)
+    if args.command == "run":
+        return _run(args.patterns, args.quick, args.output)
+    parser.print_help()
+    return 1
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="report-benchmarks",
+        description=(
+            "Benchmarks of the computational kernels in the technical reports. Run"
+            " them before and after upgrading a dependency and compare the results"
+            " to find performance regressions."
+        ),
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    for command, description in {
+        "list": "List the benchmark identifiers",
+        "run": "Run benchmarks and write the results to a JSON file",
+    }.items():
+        subparser = subparsers.add_parser(command, help=description)
+        subparser.add_argument(
+            "patterns",
+            nargs="*",
+            help="Only select benchmarks with an identifier that matches one of these"
+            " glob patterns, like 'intensity[*jit*'",
+        )
+        subparser.add_argument(
+            "--quick",
+            action="store_true",
+            help="Scan a smaller range of event counts and model sizes",
+        )
+        if command == "run":
+            subparser.add_argument(
+                "-o",
+                "--output",
+                default="benchmark-results.json",
+                type=Path,
+                help="JSON file to which the results are written",
+            )
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two runs and flag regressions"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("contender", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        default=0.1,
+        type=float,
+        help="Relative slowdown above which a benchmark counts as a regression",
+    )
+    return parser
+
+
+def _list(patterns: list[str], quick: bool) -> int:
+    for benchmark in BENCHMARKS.values():
+        for parameters in benchmark.iter_parameters(quick):
+            case_id = format_case_id(benchmark.name, parameters)
+            if patterns and not any(fnmatch(case_id, p) for p in patterns):
+                continue
+            print(f"{benchmark.report}  {case_id}")  # noqa: T201
+    return 0
+
+
+def _run(patterns: list[str], quick: bool, output: Path) -> int:
+    results = run_benchmarks(patterns, quick)
+    if not results["results"]:
+        _LOGGER.error("No benchmarks match %s", patterns)
+        return 1
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+    _LOGGER.info("Wrote %d results to %s", len(results["results"]), output)
+    return 0
+
+
+def _compare(baseline_path: Path, contender_path: Path, threshold: float) -> int:
+    baseline = _load_results(baseline_path)
+    contender = _load_results(contender_path)
+    differences = compare_metadata(baseline, contender)
+    if differences:
+        print("Differences between the runs:")  # noqa: T201
+        for difference in differences:
+            print(f"  {difference}")  # noqa: T201
+        print()  # noqa: T201
+    comparisons = compare_results(baseline, contender, threshold)
+    print(format_comparisons(comparisons))  # noqa: T201
+    regressions = [c for c in comparisons if c.status == "regression"]
+    if regressions:
+        print(  # noqa: T201
+            f"\n{len(regressions)} of {len(comparisons)} benchmarks became slower by"
+            f" more than {100 * threshold:.0f}%"
+        )
+        return 1
+    return 0
+
+
+def _load_results(path: Path) -> dict:
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        msg = (
+            f"{path} contains results of version {results.get('version')}, but this"
+            f" version of report-benchmarks can only compare version {RESULTS_VERSION}"
+        )
+        raise ValueError(msg)
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main())
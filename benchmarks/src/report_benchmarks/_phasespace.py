@@ -0,0 +1,69 @@
+"""Three-body phase space momenta with NumPy.
+
+The benchmarks only need valid four-momenta as input for the kinematic variables, so
+the momenta are not weighted. This avoids a dependency on TensorFlow.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def generate_three_body_momenta(
+    n_events: int,
+    initial_state_mass: float,
+    final_state_masses: tuple[float, float, float],
+    seed: int = 0,
+) -> dict[str, np.ndarray]:
+    """Generate four-momenta :code:`p0`, :code:`p1`, :code:`p2` in the rest frame.
+
+    The invariant mass :math:`m_{12}` is drawn uniformly and both two-body decays are
+    isotropic. Each four-momentum is an array of shape :code:`(n_events, 4)` with the
+    energy as first component.
+    """
+    rng = np.random.default_rng(seed)
+    m0, m1, m2 = final_state_masses
+    m12 = rng.uniform(m1 + m2, initial_state_mass - m0, size=n_events)
+    q = _breakup_momentum(initial_state_mass, m0, m12)
+    p0 = _to_four_momentum(m0, q[:, None] * _random_directions(rng, n_events))
+    p12 = -p0[:, 1:]
+    e12 = np.sqrt(m12**2 + q**2)
+    q12 = _breakup_momentum(m12, m1, m2)
+    direction = _random_directions(rng, n_events)
+    p1 = _to_four_momentum(m1, +q12[:, None] * direction)
+    p2 = _to_four_momentum(m2, -q12[:, None] * direction)
+    beta = p12 / e12[:, None]
+    return {"p0": p0, "p1": _boost(p1, beta), "p2": _boost(p2, beta)}
+
+
+def _breakup_momentum(
+    m: float | np.ndarray, m1: float | np.ndarray, m2: float | np.ndarray
+) -> np.ndarray:
+    kallen = (m**2 - (m1 + m2) ** 2) * (m**2 - (m1 - m2) ** 2)
+    return np.sqrt(np.maximum(kallen, 0)) / (2 * m)
+
+
+def _random_directions(rng: np.random.Generator, n_events: int) -> np.ndarray:
+    cos_theta = rng.uniform(-1, +1, size=n_events)
+    phi = rng.uniform(-np.pi, +np.pi, size=n_events)
+    sin_theta = np.sqrt(1 - cos_theta**2)
+    return np.stack(
+        [sin_theta * np.cos(phi), sin_theta * np.sin(phi), cos_theta], axis=1
+    )
+
+
+def _to_four_momentum(mass: float, three_momentum: np.ndarray) -> np.ndarray:
+    energy = np.sqrt(mass**2 + np.sum(three_momentum**2, axis=1))
+    return np.concatenate([energy[:, None], three_momentum], axis=1)
+
+
+def _boost(four_momentum: np.ndarray, beta: np.ndarray) -> np.ndarray:
+    """Boost four-momenta with velocity :code:`beta` without dividing by :math:`|β|`."""
+    energy, three_momentum = four_momentum[:, 0], four_momentum[:, 1:]
+    beta_squared = np.sum(beta**2, axis=1)
+    gamma = 1 / np.sqrt(1 - beta_squared)
+    beta_dot_p = np.sum(beta * three_momentum, axis=1)
+    boosted_energy = gamma * (energy + beta_dot_p)
+    factor = gamma**2 / (gamma + 1) * beta_dot_p + gamma * energy
+    boosted_momentum = three_momentum + factor[:, None] * beta
+    return np.concatenate([boosted_energy[:, None], boosted_momentum], axis=1)
@@ -0,0 +1,197 @@
+r"""Kernels of the performance studies in the technical reports.
+
+The kernels use a helicity model for :math:`J/\psi \to \gamma\pi^0\pi^0`, like
+in TR-012, with a variable number of :math:`f_J` resonances. The :code:`backend`
+parameter distinguishes :code:`numpy`, :code:`jax` without JIT compilation, and
+:code:`jit` (JAX with JIT compilation).
+"""
+
+from __future__ import annotations
+
+import pickle  # noqa: S403
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import ampform
+import jax
+import jax.numpy as jnp
+import numpy as np
+import qrules
+import sympy as sp
+from ampform.dynamics.builder import create_relativistic_breit_wigner_with_ff
+from ampform.sympy.math import ComplexSqrt
+from tensorwaves.data import SympyDataTransformer
+from tensorwaves.function.sympy import (
+    create_function,
+    create_parametrized_function,
+    lambdify,
+)
+
+from report_benchmarks._phasespace import generate_three_body_momenta
+from report_benchmarks.registry import register
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ampform.helicity import HelicityModel
+
+jax.config.update("jax_enable_x64", True)
+
+BACKENDS = ("numpy", "jax", "jit")
+N_EVENTS = (10_000, 100_000, 1_000_000)
+N_RESONANCES = (1, 3, 5)
+RESONANCES = ("f(0)(980)", "f(2)(1270)", "f(0)(1500)", "f(2)(1525)", "f(0)(1710)")
+
+
+@register(
+    "complex_sqrt",
+    report="TR-000",
+    backend=BACKENDS,
+    n_events=N_EVENTS,
+    quick={"n_events": (100_000,)},
+)
+def complex_sqrt(backend: str, n_events: int) -> Callable[[], Any]:
+    x = sp.Symbol("x", real=True)
+    func = lambdify(ComplexSqrt(x), [x], **_get_lambdify_options(backend))
+    data = np.random.default_rng(seed=0).uniform(-1, +1, size=n_events)
+    data = _convert_array(data, backend)
+    return lambda: jax.block_until_ready(func(data))
+
+
+@register(
+    "kinematics",
+    report="TR-012",
+    backend=BACKENDS,
+    topologies=("single", "permutated"),
+    n_events=N_EVENTS,
+    quick={"n_events": (100_000,)},
+)
+def kinematics(backend: str, topologies: str, n_events: int) -> Callable[[], Any]:
+    model = _formulate_model(n_resonances=1, permutate=topologies == "permutated")
+    transformer = SympyDataTransformer.from_sympy(
+        model.kinematic_variables, **_get_lambdify_options(backend)
+    )
+    momenta = {
+        k: _convert_array(v, backend) for k, v in _generate_momenta(n_events).items()
+    }
+    return lambda: jax.block_until_ready(transformer(momenta))
+
+
+@register(
+    "intensity",
+    report="TR-035",
+    backend=BACKENDS,
+    n_resonances=N_RESONANCES,
+    n_events=N_EVENTS,
+    quick={"n_resonances": (1,), "n_events": (100_000,)},
+)
+def intensity(backend: str, n_resonances: int, n_events: int) -> Callable[[], Any]:
+    """Monte Carlo integral of the intensity over phase space."""
+    model = _formulate_model(n_resonances)
+    func = create_parametrized_function(
+        _get_intensity_expression(n_resonances),
+        parameters=model.parameter_defaults,
+        **_get_lambdify_options(backend),
+    )
+    transformer = SympyDataTransformer.from_sympy(
+        model.kinematic_variables, backend="numpy"
+    )
+    with np.errstate(invalid="ignore"):
+        phsp = transformer(_generate_momenta(n_events))
+    phsp = {k: _convert_array(v, backend) for k, v in phsp.items()}
+    return lambda: jax.block_until_ready(func(phsp).mean())
+
+
+@register(
+    "lambdify",
+    report="TR-002",
+    n_resonances=N_RESONANCES,
+    method=("full", "split"),
+    quick={"n_resonances": (1,)},
+    number=1,
+    repeat=3,
+    clear_sympy_cache=True,
+)
+def lambdify_model(n_resonances: int, method: str) -> Callable[[], Any]:
+    """Lambdify the complete intensity or split it up into sub-expressions."""
+    expression = _get_intensity_expression(n_resonances)
+    max_complexity = {"full": None, "split": 100}[method]
+    return lambda: create_function(
+        expression, backend="numpy", max_complexity=max_complexity
+    )
+
+
+@register(
+    "serialization",
+    report="TR-024",
+    n_resonances=N_RESONANCES,
+    method=("pickle", "srepr"),
+    quick={"n_resonances": (1,)},
+    number=1,
+    clear_sympy_cache=True,
+)
+def serialization(n_resonances: int, method: str) -> Callable[[], Any]:
+    """Load the intensity expression from a serialized representation."""
+    expression = _get_intensity_expression(n_resonances)
+    if method == "pickle":
+        dump = pickle.dumps(expression)
+        return lambda: pickle.loads(dump)  # noqa: S301
+    if method == "srepr":
+        src = sp.srepr(expression)
+        namespace = vars(sp).copy()
+        return lambda: eval(src, namespace)  # noqa: S307
+    msg = f"No serialization method {method!r}"
+    raise NotImplementedError(msg)
+
+
+@cache
+def _formulate_model(n_resonances: int, permutate: bool = False) -> HelicityModel:
+    reaction = qrules.generate_transitions(
+        initial_state=("J/psi(1S)", [-1, +1]),
+        final_state=["gamma", "pi0", "pi0"],
+        allowed_intermediate_particles=list(RESONANCES[:n_resonances]),
+        allowed_interaction_types=["strong", "EM"],
+        formalism="helicity",
+    )
+    builder = ampform.get_builder(reaction)
+    for name in reaction.get_intermediate_particles().names:
+        builder.dynamics.assign(name, create_relativistic_breit_wigner_with_ff)
+    if permutate:
+        builder.adapter.permutate_registered_topologies()
+    return builder.formulate()
+
+
+@cache
+def _get_intensity_expression(n_resonances: int) -> sp.Expr:
+    return _formulate_model(n_resonances).expression.doit()
+
+
+@cache
+def _generate_momenta(n_events: int) -> dict[str, np.ndarray]:
+    particles = qrules.load_default_particles()
+    return generate_three_body_momenta(
+        n_events,
+        initial_state_mass=particles["J/psi(1S)"].mass,
+        final_state_masses=(
+            particles["gamma"].mass,
+            particles["pi0"].mass,
+            particles["pi0"].mass,
+        ),
+    )
+
+
+def _get_lambdify_options(backend: str) -> dict[str, Any]:
+    if backend == "numpy":
+        return {"backend": "numpy"}
+    if backend == "jax":
+        return {"backend": "jax", "use_jit": False}
+    if backend == "jit":
+        return {"backend": "jax", "use_jit": True}
+    msg = f"No backend {backend!r}, choose from {', '.join(BACKENDS)}"
+    raise NotImplementedError(msg)
+
+
+def _convert_array(array: np.ndarray, backend: str) -> np.ndarray | jnp.ndarray:
+    if backend == "numpy":
+        return array
+    return jnp.asarray(array)
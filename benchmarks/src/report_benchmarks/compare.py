@@ -0,0 +1,96 @@
+"""Compare the results of two benchmark runs and flag regressions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal
+
+Status = Literal["regression", "improvement", "unchanged", "new", "removed"]
+
+
+@dataclass(frozen=True)
+class Comparison:
+    case_id: str
+    baseline: float | None
+    """Fastest time per call in the baseline run, in seconds."""
+    contender: float | None
+    """Fastest time per call in the contender run, in seconds."""
+    status: Status
+
+    @property
+    def ratio(self) -> float | None:
+        if self.baseline is None or self.contender is None:
+            return None
+        return self.contender / self.baseline
+
+
+def compare_results(
+    baseline: dict[str, Any], contender: dict[str, Any], threshold: float = 0.1
+) -> list[Comparison]:
+    """Compare the fastest time per call of each benchmark in two runs.
+
+    The fastest of the repetitions is the least sensitive to other load on the
+    machine. A benchmark is flagged as a regression if it became slower by more than
+    a fraction :code:`threshold` of its baseline time.
+    """
+    baseline_times = _get_fastest_times(baseline)
+    contender_times = _get_fastest_times(contender)
+    comparisons = []
+    for case_id in sorted(baseline_times.keys() | contender_times.keys()):
+        old = baseline_times.get(case_id)
+        new = contender_times.get(case_id)
+        if old is None:
+            status: Status = "new"
+        elif new is None:
+            status = "removed"
+        elif new > (1 + threshold) * old:
+            status = "regression"
+        elif new < (1 - threshold) * old:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparisons.append(Comparison(case_id, old, new, status))
+    return comparisons
+
+
+def compare_metadata(baseline: dict[str, Any], contender: dict[str, Any]) -> list[str]:
+    """List differences in machine and package versions between two runs."""
+    differences = []
+    for section in ("machine", "packages"):
+        old_info = baseline.get(section, {})
+        new_info = contender.get(section, {})
+        for key in sorted(old_info.keys() | new_info.keys()):
+            old = old_info.get(key)
+            new = new_info.get(key)
+            if old != new:
+                differences.append(f"{key}: {old} → {new}")
+    return differences
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """Render comparisons as a Markdown table."""
+    rows = [
+        "| Benchmark | Baseline | Contender | Ratio | Status |",
+        "|:----------|---------:|----------:|------:|:-------|",
+    ]
+    for comparison in comparisons:
+        ratio = comparison.ratio
+        rows.append(
+            f"| `{comparison.case_id}` | {_format_time(comparison.baseline)} |"
+            f" {_format_time(comparison.contender)} |"
+            f" {'' if ratio is None else f'{ratio:.2f}'} | {comparison.status} |"
+        )
+    return "\n".join(rows)
+
+
+def _get_fastest_times(results: dict[str, Any]) -> dict[str, float]:
+    return {result["id"]: min(result["times"]) for result in results["results"]}
+
+
+def _format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return ""
+    for unit, factor in [("s", 1), ("ms", 1e-3), ("μs", 1e-6)]:
+        if seconds >= factor:
+            return f"{seconds / factor:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
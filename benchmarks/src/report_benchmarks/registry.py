@@ -0,0 +1,87 @@
+"""Registry of parametrized benchmarks."""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A kernel from a technical report with a grid of parameters to scan.
+
+    The :attr:`setup` function prepares the input for one combination of parameter
+    values and returns the function that is timed.
+    """
+
+    name: str
+    setup: Callable[..., Callable[[], Any]]
+    report: str
+    """Technical report from which the kernel was taken, like :code:`TR-012`."""
+    parameters: dict[str, tuple[Any, ...]]
+    quick_parameters: dict[str, tuple[Any, ...]] = field(default_factory=dict)
+    """Smaller parameter ranges that are used instead for a quick run."""
+    number: int | None = None
+    """Number of calls per repetition. Determined with `~timeit.Timer.autorange`
+    if `None`."""
+    repeat: int = 5
+    clear_sympy_cache: bool = False
+    """Clear the SymPy cache before each repetition, for kernels that create or load
+    symbolic expressions."""
+
+    def iter_parameters(self, quick: bool = False) -> Iterator[dict[str, Any]]:
+        grid = dict(self.parameters)
+        if quick:
+            grid.update(self.quick_parameters)
+        for values in itertools.product(*grid.values()):
+            yield dict(zip(grid, values, strict=True))
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def register(  # noqa: PLR0913
+    name: str,
+    *,
+    report: str,
+    quick: dict[str, tuple[Any, ...]] | None = None,
+    number: int | None = None,
+    repeat: int = 5,
+    clear_sympy_cache: bool = False,
+    **parameters: tuple[Any, ...],
+) -> Callable[[Callable[..., Callable[[], Any]]], Callable[..., Callable[[], Any]]]:
+    """Register a setup function as a `Benchmark` over a grid of parameter values."""
+
+    def decorator(
+        setup: Callable[..., Callable[[], Any]],
+    ) -> Callable[..., Callable[[], Any]]:
+        if name in BENCHMARKS:
+            msg = f"There is already a benchmark with name {name!r}"
+            raise ValueError(msg)
+        BENCHMARKS[name] = Benchmark(
+            name=name,
+            setup=setup,
+            report=report,
+            parameters=parameters,
+            quick_parameters=quick or {},
+            number=number,
+            repeat=repeat,
+            clear_sympy_cache=clear_sympy_cache,
+        )
+        return setup
+
+    return decorator
+
+
+def format_case_id(name: str, parameters: dict[str, Any]) -> str:
+    """Create a unique identifier for a benchmark with specific parameter values.
+
+    >>> format_case_id("intensity", {"backend": "jax", "n_events": 10_000})
+    'intensity[backend=jax,n_events=10000]'
+    """
+    arguments = ",".join(f"{k}={v}" for k, v in parameters.items())
+    return f"{name}[{arguments}]"
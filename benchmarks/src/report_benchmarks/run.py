@@ -0,0 +1,113 @@
+"""Time the registered benchmarks and record the results with machine metadata."""
+
+from __future__ import annotations
+
+import logging
+import os
+import platform
+import timeit
+from datetime import UTC, datetime
+from fnmatch import fnmatch
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import jax
+import sympy as sp
+
+from report_benchmarks.registry import BENCHMARKS, format_case_id
+
+if TYPE_CHECKING:
+    from report_benchmarks.registry import Benchmark
+
+RESULTS_VERSION = 1
+"""Bump this number whenever the structure of the results changes."""
+
+PACKAGES = (
+    "ampform",
+    "jax",
+    "jaxlib",
+    "numpy",
+    "qrules",
+    "sympy",
+    "tensorwaves",
+)
+"""Packages of which the version is recorded with the results."""
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def run_benchmarks(patterns: list[str] | None = None, quick: bool = False) -> dict:
+    """Run all benchmarks of which the identifier matches one of the patterns.
+
+    The identifiers have the form :code:`name[parameter=value,...]`, see
+    `.format_case_id`, and the patterns are matched with `fnmatch.fnmatch`.
+    """
+    results = []
+    for benchmark in BENCHMARKS.values():
+        for parameters in benchmark.iter_parameters(quick):
+            case_id = format_case_id(benchmark.name, parameters)
+            if patterns and not any(fnmatch(case_id, p) for p in patterns):
+                continue
+            _LOGGER.info("Running %s", case_id)
+            result = _time_case(benchmark, parameters)
+            _LOGGER.info("  %.3g s per call", min(result["times"]))
+            results.append(result)
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "machine": get_machine_metadata(),
+        "packages": {name: _get_version(name) for name in PACKAGES},
+        "results": results,
+    }
+
+
+def _time_case(benchmark: Benchmark, parameters: dict[str, Any]) -> dict[str, Any]:
+    start = perf_counter()
+    func = benchmark.setup(**parameters)
+    setup_time = perf_counter() - start
+    setup = sp.core.cache.clear_cache if benchmark.clear_sympy_cache else "pass"
+    timer = timeit.Timer(func, setup=setup)
+    first_call_time = timer.timeit(number=1)
+    number = benchmark.number
+    if number is None:
+        number, _ = timer.autorange()
+    timings = timer.repeat(repeat=benchmark.repeat, number=number)
+    return {
+        "id": format_case_id(benchmark.name, parameters),
+        "benchmark": benchmark.name,
+        "report": benchmark.report,
+        "parameters": parameters,
+        "setup": setup_time,
+        "first_call": first_call_time,
+        "number": number,
+        "times": [t / number for t in timings],
+    }
+
+
+def get_machine_metadata() -> dict[str, Any]:
+    """Collect information about the machine on which the benchmarks run."""
+    return {
+        "platform": platform.platform(),
+        "processor": _get_processor_name(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "jax_devices": [str(device) for device in jax.devices()],
+    }
+
+
+def _get_processor_name() -> str:
+    cpu_info = Path("/proc/cpuinfo")
+    if cpu_info.exists():
+        for line in cpu_info.read_text().splitlines():
+            if line.startswith("model name"):
+                return line.split(":", maxsplit=1)[1].strip()
+    return platform.processor()
+
+
+def _get_version(package_name: str) -> str | None:
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        return None
@@ -0,0 +1,193 @@
+"""Execute the technical reports with a content-addressed output cache.
+
+Each report is executed in its own kernel from within its report directory, so that
+the ``pyproject_local_kernel`` kernel runs it in the per-report environment that is
+defined by its :file:`pyproject.toml` and :file:`uv.lock`. The executed notebooks
+are stored under :file:`.cache/notebooks/` with a hash of the code cells and the
+environment files as file name. A notebook is therefore only executed again if its
+code or its environment changed.
+
+Heavy reports can be marked as *frozen*. They are never executed, unless the
+``ALL_NOTEBOOKS`` environment variable is set, but an existing cache entry is still
+used. Without a cache entry, as on a fresh CI runner, the outputs that are committed
+to the notebook are rendered.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import nbformat
+from nbclient import NotebookClient
+from sphinx.util import logging
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from nbformat import NotebookNode
+    from sphinx.application import Sphinx
+
+_CACHE_VERSION = 1
+"""Bump this number whenever the way in which the cache key is computed changes."""
+
+_ENVIRONMENT_FILES = (
+    "Manifest.toml",
+    "Project.toml",
+    "pyproject.toml",
+    "uv.lock",
+)
+"""Files in a report directory that define the environment in which it is executed."""
+
+_LOGGER = logging.getLogger(__name__)
+_CACHED_NOTEBOOKS: dict[str, Path] = {}
+"""Executed notebooks for each document name, filled by :func:`main`."""
+
+
+def main(
+    exclude: Iterable[str] = (), frozen: Iterable[str] = (), force: bool = False
+) -> None:
+    """Execute all technical reports of which the code or environment changed.
+
+    Args:
+        exclude: Patterns of notebook paths relative to the :file:`docs` folder that
+            should not be executed at all.
+        frozen: Patterns of notebook paths that should not be executed, but of which
+            an up-to-date cache entry is used if there is one.
+        force: Execute all notebooks that are not frozen, even if there is an
+            up-to-date cache entry.
+
+    Raises:
+        RuntimeError: If one of the notebooks could not be executed. The cache entry
+            of that notebook is removed, so that it is not reused in the next build.
+    """
+    this_dir = Path(__file__).parent
+    cache_dir = this_dir / ".cache" / "notebooks"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    exclude, frozen = list(exclude), list(frozen)
+    outdated: dict[Path, Path] = {}
+    for notebook in _get_technical_report_paths():
+        rel_path = notebook.relative_to(this_dir).as_posix()
+        if any(fnmatch(rel_path, pattern) for pattern in exclude):
+            continue
+        cache_path = cache_dir / f"{_compute_cache_key(notebook)}.ipynb"
+        is_frozen = any(fnmatch(rel_path, pattern) for pattern in frozen)
+        if is_frozen and not cache_path.exists():
+            continue
+        if not is_frozen and (force or not cache_path.exists()):
+            outdated[notebook] = cache_path
+        else:
+            _CACHED_NOTEBOOKS[_to_docname(notebook)] = cache_path
+    if not outdated:
+        return
+    n_workers = min(len(outdated), os.cpu_count() or 1)
+    _LOGGER.info(
+        "Executing %d notebooks with %d worker processes", len(outdated), n_workers
+    )
+    failed: list[str] = []
+    with ProcessPoolExecutor(
+        max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {
+            executor.submit(_execute_notebook, notebook, cache_path): notebook
+            for notebook, cache_path in outdated.items()
+        }
+        for future in as_completed(futures):
+            notebook = futures[future]
+            rel_path = notebook.relative_to(this_dir).as_posix()
+            try:
+                cache_path = future.result()
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.error("Failed to execute %s\n%s", rel_path, exc)  # noqa: TRY400
+                outdated[notebook].unlink(missing_ok=True)
+                failed.append(rel_path)
+                continue
+            _LOGGER.info("Executed %s", rel_path)
+            _CACHED_NOTEBOOKS[_to_docname(notebook)] = cache_path
+    if failed:
+        msg = f"Failed to execute {len(failed)} notebooks: {', '.join(sorted(failed))}"
+        raise RuntimeError(msg)
+
+
+def insert_cached_outputs(app: Sphinx, docname: str, source: list[str]) -> None:
+    """Replace the outputs of a notebook with those of its executed cache entry.
+
+    Connect this function to the :code:`source-read` event. Only the outputs of the
+    code cells are taken from the cache entry, so that changes to the Markdown cells
+    show up without executing the notebook again.
+    """
+    cache_path = _CACHED_NOTEBOOKS.get(docname)
+    if cache_path is None:
+        return
+    notebook = nbformat.reads(source[0], as_version=nbformat.NO_CONVERT)
+    executed = nbformat.read(cache_path, as_version=nbformat.NO_CONVERT)
+    for cell, executed_cell in zip(
+        _get_code_cells(notebook), _get_code_cells(executed), strict=True
+    ):
+        cell["execution_count"] = executed_cell.get("execution_count")
+        cell["outputs"] = executed_cell.get("outputs", [])
+    widgets = executed.metadata.get("widgets")
+    if widgets is not None:
+        notebook.metadata["widgets"] = widgets
+    source[0] = nbformat.writes(notebook)
+
+
+def _get_technical_report_paths() -> list[Path]:
+    report_dir = Path(__file__).parent
+    return sorted(report_dir.glob("???/index.ipynb"))
+
+
+def _to_docname(notebook: Path) -> str:
+    rel_path = notebook.relative_to(Path(__file__).parent)
+    return rel_path.with_suffix("").as_posix()
+
+
+def _compute_cache_key(notebook: Path) -> str:
+    """Compute a hash of the code cells of a notebook and its environment files.
+
+    Markdown cells and outputs are not hashed, so editing the text of a report or
+    executing it locally does not invalidate its cache entry.
+    """
+    nb = nbformat.read(notebook, as_version=nbformat.NO_CONVERT)
+    sha256 = hashlib.sha256(f"version {_CACHE_VERSION}\n".encode())
+    kernel_name = nb.metadata.get("kernelspec", {}).get("name", "")
+    sha256.update(f"kernel {kernel_name}\n".encode())
+    for cell in _get_code_cells(nb):
+        sha256.update(b"cell\n")
+        sha256.update(cell.source.encode())
+    for filename in _ENVIRONMENT_FILES:
+        path = notebook.parent / filename
+        if not path.exists():
+            continue
+        sha256.update(f"file {filename}\n".encode())
+        sha256.update(path.read_bytes())
+    return sha256.hexdigest()
+
+
+def _get_code_cells(notebook: NotebookNode) -> list[NotebookNode]:
+    return [cell for cell in notebook.cells if cell.cell_type == "code"]
+
+
+def _execute_notebook(notebook: Path, cache_path: Path) -> Path:
+    """Execute a notebook in its report directory and write it to the cache.
+
+    This function runs in a worker process. The notebook is written to a temporary
+    file first, so that an interrupted build does not leave a broken cache entry.
+    """
+    nb = nbformat.read(notebook, as_version=nbformat.NO_CONVERT)
+    client = NotebookClient(
+        nb,
+        kernel_name=nb.metadata.get("kernelspec", {}).get("name", "python3"),
+        resources={"metadata": {"path": str(notebook.parent)}},
+        timeout=None,
+    )
+    client.execute()
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    nbformat.write(nb, tmp_path)
+    tmp_path.replace(cache_path)
+    return cache_path
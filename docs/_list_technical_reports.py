@@ -1,26 +1,37 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from pathlib import Path
 from textwrap import dedent
-from typing import TYPE_CHECKING
-
-import nbformat
+from typing import TYPE_CHECKING, Any, TextIO
 
 if TYPE_CHECKING:
-    from nbformat import NotebookNode
+    from collections.abc import Iterator
+
+_CACHE_VERSION = 1
+"""Bump this number whenever the structure of the extracted card info changes."""
+_CHUNK_SIZE = 2**16
 
 
 def main() -> int:
-    table = _create_tr_table()
     this_dir = Path(__file__).parent
+    cache_path = this_dir / ".cache" / "technical-reports.json"
+    cache = _load_cache(cache_path)
+    table = _create_tr_table(cache)
+    _dump_cache(cache, cache_path)
     output_path = this_dir / "_inventory.md"
+    if output_path.exists() and output_path.read_text() == table:
+        return 0
     with open(output_path, "w") as f:
         f.write(table)
     return 0
 
 
-def _create_tr_table() -> str:
+def _create_tr_table(cache: dict[str, Any] | None = None) -> str:
+    if cache is None:
+        cache = {}
     notebook_paths = _get_technical_report_paths()
     src = dedent(
         """
@@ -29,7 +40,7 @@ def _create_tr_table() -> str:
     """
     ).strip()
     for notebook in notebook_paths:
-        card_info = _get_card_info(notebook)
+        card_info = _get_cached_card_info(notebook, cache)
         tr = card_info["tr"]
         title = card_info["title"]
         details = re.sub(
@@ -48,6 +59,7 @@ def _create_tr_table() -> str:
             f"\n| | **[TR&#8209;{tr}]({tr}/index.ipynb)** | {title} | {details} | {tags} |"
             f" {status} |"
         )
+    _prune_cache(cache, notebook_paths)
     return src
 
 
@@ -60,23 +72,95 @@ def _get_technical_report_paths() -> list[Path]:
     return sorted(report_dir.glob("???/index.ipynb"))
 
 
+def _load_cache(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+        return {}
+    return cache.get("entries", {})
+
+
+def _dump_cache(cache: dict[str, Any], path: Path) -> None:
+    content = json.dumps(
+        {"version": _CACHE_VERSION, "entries": cache}, indent=1, sort_keys=True
+    )
+    if path.exists() and path.read_text() == content:
+        return
+    path.parent.mkdir(exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def _prune_cache(cache: dict[str, Any], notebook_paths: list[Path]) -> None:
+    """Remove entries of notebooks that have been renamed or deleted."""
+    keys = {_get_cache_key(path) for path in notebook_paths}
+    for key in cache.keys() - keys:
+        del cache[key]
+
+
+def _get_cache_key(path: Path) -> str:
+    return path.relative_to(Path(__file__).parent).as_posix()
+
+
+def _get_cached_card_info(path: Path, cache: dict[str, Any]) -> dict[str, str]:
+    """Get the card info of a notebook, parsing it only if it changed.
+
+    Cache entries are keyed by the notebook path and validated first by the
+    modification time and size of the file, then by a hash of its content, so that
+    touching a notebook without changing it does not require parsing it again.
+    """
+    key = _get_cache_key(path)
+    stat = path.stat()
+    entry = cache.get(key)
+    if entry is not None and [entry["mtime"], entry["size"]] == [
+        stat.st_mtime_ns,
+        stat.st_size,
+    ]:
+        return entry["info"]
+    sha256 = _compute_sha256(path)
+    if entry is not None and entry["sha256"] == sha256:
+        info = entry["info"]
+    else:
+        info = _get_card_info(path)
+    cache[key] = {
+        "info": info,
+        "mtime": stat.st_mtime_ns,
+        "sha256": sha256,
+        "size": stat.st_size,
+    }
+    return info
+
+
+def _compute_sha256(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
 def _get_card_info(path: Path) -> dict[str, str]:
-    notebook = _open_notebook(path)
-    for cell in notebook["cells"]:
-        if cell["cell_type"] != "markdown":
-            continue
-        src: list[str] = cell["source"].splitlines()
-        src = [s for s in src if s.strip() if not s.strip().startswith("<!--")]
-        if len(src) < 5:  # noqa: PLR2004
-            continue
-        line1, line2, line3, *_ = src
-        if line1 != "::::{margin}":
-            continue
-        if not line2.startswith(":::{card} "):
-            continue
-        if not line3.startswith("TR-"):
-            continue
-        return _extract_card_info(cell)
+    with open(path, encoding="utf-8") as f:
+        for cell in _iterate_cells(f):
+            if cell["cell_type"] != "markdown":
+                continue
+            src: list[str] = cell["source"].splitlines()
+            src = [s for s in src if s.strip() if not s.strip().startswith("<!--")]
+            if len(src) < 5:  # noqa: PLR2004
+                continue
+            line1, line2, line3, *_ = src
+            if line1 != "::::{margin}":
+                continue
+            if not line2.startswith(":::{card} "):
+                continue
+            if not line3.startswith("TR-"):
+                continue
+            return _extract_card_info(cell)
     repo_dir = Path(__file__).parent.parent
     msg = (
         f"Technical report {path.relative_to(repo_dir)} does not contain an info card."
@@ -85,11 +169,47 @@ def _get_card_info(path: Path) -> dict[str, str]:
     raise RuntimeError(msg)
 
 
-def _open_notebook(path: Path) -> NotebookNode:
-    return nbformat.read(path, as_version=nbformat.NO_CONVERT)
+def _iterate_cells(stream: TextIO) -> Iterator[dict[str, Any]]:
+    """Decode the cells of a notebook one by one, without reading the full file.
+
+    The info card is one of the first cells, so this avoids reading and decoding the
+    (possibly large) outputs of the remaining cells. The file is read in chunks and
+    a cell is decoded as soon as the buffer contains all of it.
+    """
+    buffer = ""
+    match = None
+    while match is None:
+        chunk = stream.read(_CHUNK_SIZE)
+        if not chunk:
+            return
+        buffer += chunk
+        match = re.search(r'"cells"\s*:\s*\[', buffer)
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r"[\s,]*")
+    buffer = buffer[match.end() :]
+    while True:
+        buffer = buffer[whitespace.match(buffer).end() :]
+        try:
+            if buffer.startswith("]"):
+                return
+            cell, idx = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            # the cell is incomplete, so read more; growing the chunk size keeps
+            # the number of decoding attempts for large cells logarithmic
+            chunk = stream.read(max(_CHUNK_SIZE, len(buffer)))
+            if not chunk:
+                raise
+            buffer += chunk
+            continue
+        buffer = buffer[idx:]
+        source = cell.get("source", "")
+        if isinstance(source, list):
+            cell["source"] = "".join(source)
+        cell.setdefault("metadata", {})
+        yield cell
 
 
-def _extract_card_info(cell: NotebookNode) -> dict[str, str]:
+def _extract_card_info(cell: dict[str, Any]) -> dict[str, str]:
     src = cell["source"]
     _, line2, line3, *rest = src.splitlines()
     info = {
@@ -107,7 +227,7 @@ def _extract_card_info(cell: NotebookNode) -> dict[str, str]:
 
 
 def extract_body(rest: str) -> str | None:
-    body = rest.split(":::", maxsplit=1)[0].split("+++")[0].strip()
+    body = rest.split(":::", maxsplit=1)[0].split("+++", maxsplit=1)[0].strip()
     if "^^^" in body:
         body = body.split("^^^")[1].strip()
     return body.replace("\n", "<br>")
@@ -116,7 +236,7 @@ def extract_body(rest: str) -> str | None:
 def _extract_footer(src: str) -> str | None:
     if "+++" not in src:
         return None
-    return src.split("+++")[1].split(":::")[0].strip()
+    return src.split("+++", maxsplit=2)[1].split(":::", maxsplit=1)[0].strip()
 
 
 if __name__ == "__main__":
@@ -10,13 +10,18 @@ import os
 import shutil
 import subprocess  # noqa: S404
 import sys
+from typing import TYPE_CHECKING
 
 from sphinx_api_relink.helpers import get_execution_mode
 from sphinx_api_relink.linkcode import _get_commit_sha
 
 sys.path.insert(0, os.path.abspath("."))
+import _execute_notebooks
 import _list_technical_reports
 
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+
 
 def get_nb_exclusion_patterns() -> list[str]:
     exclusions = {
@@ -29,36 +34,50 @@ def get_nb_exclusion_patterns() -> list[str]:
             "019*",
         }
         exclusions.update(julia_notebooks)
-    if "ALL_NOTEBOOKS" not in os.environ:
-        frozen_notebooks = {
-            "001/*",
-            "003/*",
-            "005/*",
-            "008/*",
-            "009/*",
-            "010/*",
-            "012/*",
-            "013/*",
-            "014/*",
-            "015/*",
-            "017/*",
-            "018/*",
-            "019/*",
-            "020/*",
-            "021/*",
-            "022/*",
-            "028/*",
-            "030/*",
-            "031/*",
-            "032/*",
-            "033/*",
-            "034/*",
-            "035/*",
-        }
-        exclusions.update(frozen_notebooks)
     return sorted(exclusions)
 
 
+def get_frozen_notebook_patterns() -> list[str]:
+    if "ALL_NOTEBOOKS" in os.environ:
+        return []
+    return [
+        "001/*",
+        "003/*",
+        "005/*",
+        "008/*",
+        "009/*",
+        "010/*",
+        "012/*",
+        "013/*",
+        "014/*",
+        "015/*",
+        "017/*",
+        "018/*",
+        "019/*",
+        "020/*",
+        "021/*",
+        "022/*",
+        "028/*",
+        "030/*",
+        "031/*",
+        "032/*",
+        "033/*",
+        "034/*",
+        "035/*",
+    ]
+
+
+def execute_notebooks() -> None:
+    execution_mode = get_execution_mode()
+    if execution_mode == "off":
+        return
+    _execute_notebooks.main(
+        exclude=get_nb_exclusion_patterns(),
+        frozen=get_frozen_notebook_patterns(),
+        force=execution_mode == "force",
+    )
+
+
 def install_ijulia() -> None:
     if shutil.which("julia") is None:
         return
@@ -68,6 +87,7 @@ def install_ijulia() -> None:
 
 _list_technical_reports.main()
 install_ijulia()
+execute_notebooks()
 
 BRANCH = _get_commit_sha()
 ORGANIZATION = "ComPWA"
@@ -101,7 +121,9 @@ copybutton_prompt_text = r">>> |\.\.\. "  # doctest
 copyright = f"2020, {ORGANIZATION}"
 default_role = "py:obj"
 exclude_patterns = [
+    ".cache",
     "_build",
+    "**/.cache",
     "**/.ipynb_checkpoints",
     "**/.venv",
     "**/.virtual_documents",
@@ -259,7 +281,7 @@ modify the parameters.
 """,
 }
 myst_update_mathjax = False
-nb_execution_excludepatterns = get_nb_exclusion_patterns()
+nb_execution_excludepatterns = ["???/*"]  # executed by _execute_notebooks
 nb_execution_mode = get_execution_mode()
 nb_execution_show_tb = True
 nb_execution_timeout = -1
@@ -283,3 +305,7 @@ thebe_config = {
     "repository_branch": html_theme_options["repository_branch"],
 }
 todo_include_todos = True
+
+
+def setup(app: Sphinx) -> None:
+    app.connect("source-read", _execute_notebooks.insert_cached_outputs)